@@ -43,8 +43,6 @@ def main(lab_name: str) -> None:  # pylint: disable=too-many-branches
             print("no files to move")
 
         if target_score > 4:
-            for meta_file in PROJECT_ROOT.glob("*_meta.json"):
-                shutil.move(meta_file, ASSETS_PATH)
             pos_files = list(PROJECT_ROOT.glob("*_pos_conllu.conllu"))
             if len(pos_files) != 0:
                 for pos_file in pos_files:
@@ -6,6 +6,7 @@ import json
 import re
 import time
 from copy import deepcopy
+from importlib.util import find_spec
 
 import bs4 as bs
 import requests
@@ -24,6 +25,10 @@ from config.website_validation.utils import (create_driver, define_blacklist_and
                                              SiteCheckStatus)
 from lab_5_scrapper.scrapper import Config, make_request
 
+SERVICE_SYMBOLS_PATTERN = re.compile(r"[\s\n\t\"\'.…]")
+HTML_PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+LINKS_STRAINER = bs.SoupStrainer('a')
+
 
 def get_requests_required_headers(url: str, config: Config) -> list:
     """
@@ -76,7 +81,9 @@ def is_site_dynamic(url: str, config: Config, headless: bool = True) -> SiteChec
 
         print(f'\t\tplain GET: {response.status_code}')
 
-        soup = bs.BeautifulSoup(response.text, 'html.parser')
+        soup = bs.BeautifulSoup(response.content, HTML_PARSER,
+                                from_encoding=response.encoding,
+                                parse_only=LINKS_STRAINER)
 
         if not soup.find_all('a'):
             return SiteCheckStatus(CheckStatuses.DYNAMIC, 'empty HTML using requests')
@@ -193,7 +200,7 @@ def get_links_with_one_of_names(driver: WebDriver, names: list) -> list[WebEleme
     def validate_element(element: WebElement, search_name: str) -> bool:
         if search_name.lower().strip() not in element.text.lower() \
                 or element.location['y'] < 20 or \
-                len(re.sub(r"[\s\n\t\"\'.…]", "", element.text)) > len(search_name) * 1.5:
+                len(SERVICE_SYMBOLS_PATTERN.sub("", element.text)) > len(search_name) * 1.5:
             return False
 
         return True
@@ -65,11 +65,10 @@ def to_meta(article: Article) -> None:
         article (Article): Article instance
     """
     with open(article.get_meta_file_path(), 'w', encoding='utf-8') as meta_file:
-        json.dump(article.get_meta(),
-                  meta_file,
-                  indent=4,
-                  ensure_ascii=False,
-                  separators=(',', ': '))
+        meta_file.write(json.dumps(article.get_meta(),
+                                   indent=4,
+                                   ensure_ascii=False,
+                                   separators=(',', ': ')))
 
 
 def from_meta(path: Union[pathlib.Path, str],